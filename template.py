@@ -3,11 +3,28 @@ Low-Level Design Interview Template
 Incorporates: SOLID Principles, Design Patterns, Best Practices
 """
 
-from abc import ABC, abstractmethod
+from collections import deque
+import functools
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import Callable, Deque, List, Dict, Optional, Tuple
 from datetime import datetime
+import queue
+import sys
 import threading
+import time
+import traceback
+
+try:
+    import numpy as np
+except ImportError:  # Only ColumnarRepository needs numpy
+    np = None
+
+
+def _out_write(text: str):
+    """Write to the current sys.stdout, skipping print()'s argument handling"""
+    out = sys.stdout
+    if out is not None:
+        out.write(text)
 
 
 # ============================================================================
@@ -19,109 +36,342 @@ class EntityStatus(Enum):
     PENDING = "PENDING"
 
 
+# Module-level aliases: one global load instead of an Enum class lookup on hot paths
+ACTIVE = EntityStatus.ACTIVE
+INACTIVE = EntityStatus.INACTIVE
+PENDING = EntityStatus.PENDING
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """Exact local datetime for epoch nanoseconds (no float rounding)"""
+    seconds, remainder = divmod(ns, 10**9)
+    return datetime.fromtimestamp(seconds).replace(microsecond=remainder // 1000)
+
+
 # ============================================================================
 # MODELS - Core domain entities (Single Responsibility Principle)
 # ============================================================================
 class BaseEntity:
-    """Base class for all entities with common attributes"""
+    """Base class for all entities with common attributes
+
+    Timestamps are stored as integer nanoseconds since the epoch; the
+    created_at/updated_at properties build datetimes only when read.
+    """
+
+    __slots__ = ("id", "created_at_ns", "updated_at_ns")
 
     def __init__(self, id: str):
         self.id = id
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.created_at_ns = self.updated_at_ns = time.time_ns()
 
     def update_timestamp(self):
-        self.updated_at = datetime.now()
+        self.updated_at_ns = time.time_ns()
+
+    @property
+    def created_at(self) -> datetime:
+        return _ns_to_datetime(self.created_at_ns)
+
+    @property
+    def updated_at(self) -> datetime:
+        return _ns_to_datetime(self.updated_at_ns)
 
 
 class User(BaseEntity):
     """Example entity - Replace with your domain model"""
 
+    __slots__ = ("name", "email", "status")
+
+    # Opt-in free list of released Users; when full, the oldest entries are
+    # evicted. Each subclass gets its own pool (see __init_subclass__).
+    _pool: Deque["User"] = deque(maxlen=1024)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._pool = deque(maxlen=1024)
+
     def __init__(self, id: str, name: str, email: str):
         super().__init__(id)
         self.name = name
         self.email = email
-        self.status = EntityStatus.ACTIVE
+        self.status = ACTIVE
+
+    @classmethod
+    def acquire(cls, id: str, name: str, email: str) -> "User":
+        """Reset and reuse a pooled User, or allocate one if the pool is empty"""
+        pool = cls._pool
+        if not pool:
+            return cls(id, name, email)
+        user = pool.pop()
+        user.id = id
+        user.name = name
+        user.email = email
+        user.status = ACTIVE
+        user.created_at_ns = user.updated_at_ns = time.time_ns()
+        return user
+
+    @classmethod
+    def release(cls, user: "User"):
+        """Return a User to the pool (opt-in)
+
+        Only release a User that nothing else references: not one handed out
+        by UserService.create_user, nor one with notifications still queued.
+        """
+        type(user)._pool.append(user)
 
 
 # ============================================================================
 # INTERFACES - Define contracts (Interface Segregation Principle)
+# Plain base classes: methods raise NotImplementedError until overridden
 # ============================================================================
-class IRepository(ABC):
+class IRepository:
     """Generic repository interface"""
 
-    @abstractmethod
     def get_by_id(self, id: str):
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def save(self, entity):
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def delete(self, id: str):
-        pass
+        raise NotImplementedError
 
 
-class INotificationService(ABC):
+class INotificationService:
     """Notification service interface (Dependency Inversion Principle)"""
 
-    @abstractmethod
     def send(self, recipient: str, message: str):
-        pass
+        raise NotImplementedError
 
 
 # ============================================================================
 # REPOSITORIES - Data access layer (Single Responsibility)
 # ============================================================================
 class InMemoryRepository(IRepository):
-    """Thread-safe in-memory repository implementation"""
+    """Thread-safe in-memory repository implementation
+
+    Storage is split into SHARD_COUNT dicts chosen by hash(id), each with its
+    own lock for writes, so writers on unrelated ids never contend (this
+    matters on free-threaded CPython). Reads are single dict operations on str
+    keys, which are atomic, so they take no lock.
+    """
+
+    SHARD_COUNT = 16  # Must be a power of two
 
     def __init__(self):
-        self._storage: Dict[str, any] = {}
-        self._lock = threading.Lock()
+        self._shards: List[Dict[str, any]] = [{} for _ in range(self.SHARD_COUNT)]
+        self._locks = [threading.Lock() for _ in range(self.SHARD_COUNT)]
+
+    def _shard(self, id: str) -> int:
+        return hash(id) & (self.SHARD_COUNT - 1)
 
     def get_by_id(self, id: str):
-        with self._lock:
-            return self._storage.get(id)
+        return self._shards[self._shard(id)].get(id)
 
     def save(self, entity):
-        with self._lock:
+        shard = self._shard(entity.id)
+        with self._locks[shard]:
             entity.update_timestamp()
-            self._storage[entity.id] = entity
+            self._shards[shard][entity.id] = entity
 
     def delete(self, id: str):
-        with self._lock:
-            if id in self._storage:
-                del self._storage[id]
+        shard = self._shard(id)
+        with self._locks[shard]:
+            self._shards[shard].pop(id, None)
 
     def get_all(self) -> List:
+        # Each shard is copied atomically; the result is not a global snapshot
+        entities = []
+        for shard in self._shards:
+            entities.extend(list(shard.values()))
+        return entities
+
+
+class UserView:
+    """Read-only User over one ColumnarRepository row; fields are read lazily
+
+    Once the user is deleted from the repository, every field reads as None.
+    To update a user, call to_user(), modify the returned User and save() it.
+    """
+
+    __slots__ = ("_repository", "id")
+
+    def __init__(self, repository: "ColumnarRepository", id: str):
+        self._repository = repository
+        self.id = id
+
+    def _field(self, column: str):
+        repository = self._repository
+        # Locked so delete() row moves and _grow() array swaps can't interleave
+        with repository._lock:
+            row = repository._rows.get(self.id)
+            if row is None:
+                return None
+            return getattr(repository, column)[row]
+
+    def to_user(self) -> Optional[User]:
+        """Copy the row into a mutable User, or None if it was deleted"""
+        repository = self._repository
+        with repository._lock:
+            row = repository._rows.get(self.id)
+            if row is None:
+                return None
+            user = User(self.id, repository._names[row], repository._emails[row])
+            user.status = _STATUSES[repository._statuses[row]]
+            user.created_at_ns = int(repository._created_at_ns[row])
+            user.updated_at_ns = int(repository._updated_at_ns[row])
+        return user
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._field("_names")
+
+    @property
+    def email(self) -> Optional[str]:
+        return self._field("_emails")
+
+    @property
+    def status(self) -> Optional[EntityStatus]:
+        code = self._field("_statuses")
+        return None if code is None else _STATUSES[code]
+
+    @property
+    def created_at_ns(self) -> Optional[int]:
+        ns = self._field("_created_at_ns")
+        return None if ns is None else int(ns)
+
+    @property
+    def updated_at_ns(self) -> Optional[int]:
+        ns = self._field("_updated_at_ns")
+        return None if ns is None else int(ns)
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        ns = self.created_at_ns
+        return None if ns is None else _ns_to_datetime(ns)
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        ns = self.updated_at_ns
+        return None if ns is None else _ns_to_datetime(ns)
+
+
+_STATUSES: List[EntityStatus] = list(EntityStatus)
+_STATUS_CODES: Dict[EntityStatus, int] = {s: i for i, s in enumerate(_STATUSES)}
+
+
+class ColumnarRepository(IRepository):
+    """User repository storing each field in its own NumPy column (requires numpy)
+
+    Rows are packed densely: delete() moves the last row into the hole, and
+    an id -> row dict locates users. Bulk scans such as get_active_ids() run
+    as vectorized NumPy operations instead of Python loops. get_by_id returns
+    a read-only UserView; save() takes a User (see UserView.to_user).
+    """
+
+    _COLUMNS = (
+        "_ids",
+        "_names",
+        "_emails",
+        "_statuses",
+        "_created_at_ns",
+        "_updated_at_ns",
+    )
+
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise ImportError("ColumnarRepository requires numpy")
+        self._rows: Dict[str, int] = {}
+        self._size = 0
+        self._ids = np.empty(capacity, dtype=object)
+        self._names = np.empty(capacity, dtype=object)
+        self._emails = np.empty(capacity, dtype=object)
+        self._statuses = np.zeros(capacity, dtype=np.uint8)
+        self._created_at_ns = np.zeros(capacity, dtype=np.int64)
+        self._updated_at_ns = np.zeros(capacity, dtype=np.int64)
+        self._lock = threading.Lock()
+
+    def get_by_id(self, id: str) -> Optional[UserView]:
+        if id in self._rows:
+            return UserView(self, id)
+        return None
+
+    def save(self, entity: User):
+        entity.update_timestamp()
+        with self._lock:
+            row = self._rows.get(entity.id)
+            if row is None:
+                row = self._size
+                if row == len(self._ids):
+                    self._grow()
+                self._size += 1
+            self._ids[row] = entity.id
+            self._names[row] = entity.name
+            self._emails[row] = entity.email
+            self._statuses[row] = _STATUS_CODES[entity.status]
+            self._created_at_ns[row] = entity.created_at_ns
+            self._updated_at_ns[row] = entity.updated_at_ns
+            self._rows[entity.id] = row
+
+    def delete(self, id: str):
+        with self._lock:
+            row = self._rows.pop(id, None)
+            if row is None:
+                return
+            last = self._size - 1
+            if row != last:
+                for name in self._COLUMNS:
+                    column = getattr(self, name)
+                    column[row] = column[last]
+                self._rows[self._ids[row]] = row
+            self._ids[last] = self._names[last] = self._emails[last] = None
+            self._size = last
+
+    def get_all(self) -> List[UserView]:
         with self._lock:
-            return list(self._storage.values())
+            ids = self._ids[: self._size].tolist()
+        return [UserView(self, id) for id in ids]
+
+    def get_active_ids(self) -> List[str]:
+        with self._lock:
+            size = self._size
+            mask = self._statuses[:size] == _STATUS_CODES[ACTIVE]
+            return self._ids[:size][mask].tolist()
+
+    def _grow(self):
+        capacity = max(1, 2 * len(self._ids))
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            if old.dtype == object:
+                new = np.empty(capacity, dtype=object)
+            else:
+                new = np.zeros(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
 
 
 # ============================================================================
 # SINGLETON PATTERN - For system-wide single instance
 # ============================================================================
-class ConfigManager:
-    """Thread-safe singleton for configuration management"""
+class SingletonMeta(type):
+    """Metaclass that builds the single instance when the class is defined
 
-    _instance = None
-    _lock = threading.Lock()
-
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+    Calling the class just returns that instance, so __init__ runs exactly
+    once and no lock or initialized flag is needed.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._instance = super().__call__()
+
+    def __call__(cls):
         return cls._instance
 
+
+class ConfigManager(metaclass=SingletonMeta):
+    """Singleton for configuration management"""
+
     def __init__(self):
-        if self._initialized:
-            return
         self._config = {}
-        self._initialized = True
 
     def set(self, key: str, value: any):
         self._config[key] = value
@@ -134,36 +384,50 @@ class ConfigManager:
 # FACTORY PATTERN - Object creation
 # ============================================================================
 class NotificationFactory:
-    """Factory for creating notification services"""
+    """Factory for creating notification services
+
+    Types map to classes in _REGISTRY; register new ones there (Open/Closed).
+    Services are stateless, so one shared instance per type is cached.
+    """
+
+    _REGISTRY: Dict[str, type] = {}
+    _cache: Dict[str, INotificationService] = {}
 
     @staticmethod
     def create_notification_service(type: str) -> INotificationService:
-        if type == "EMAIL":
-            return EmailNotificationService()
-        elif type == "SMS":
-            return SMSNotificationService()
-        raise ValueError(f"Unknown notification type: {type}")
+        service = NotificationFactory._cache.get(type)
+        if service is None:
+            service_cls = NotificationFactory._REGISTRY.get(type)
+            if service_cls is None:
+                raise ValueError(f"Unknown notification type: {type}")
+            service = NotificationFactory._cache.setdefault(type, service_cls())
+        return service
 
 
 class EmailNotificationService(INotificationService):
     def send(self, recipient: str, message: str):
-        print(f"Email sent to {recipient}: {message}")
+        _out_write(f"Email sent to {recipient}: {message}\n")
 
 
 class SMSNotificationService(INotificationService):
     def send(self, recipient: str, message: str):
-        print(f"SMS sent to {recipient}: {message}")
+        _out_write(f"SMS sent to {recipient}: {message}\n")
+
+
+NotificationFactory._REGISTRY = {
+    "EMAIL": EmailNotificationService,
+    "SMS": SMSNotificationService,
+}
 
 
 # ============================================================================
 # STRATEGY PATTERN - Interchangeable algorithms
 # ============================================================================
-class IProcessingStrategy(ABC):
+class IProcessingStrategy:
     """Strategy interface for processing logic"""
 
-    @abstractmethod
     def process(self, data: any):
-        pass
+        raise NotImplementedError
 
 
 class StandardProcessingStrategy(IProcessingStrategy):
@@ -179,45 +443,111 @@ class PremiumProcessingStrategy(IProcessingStrategy):
 # ============================================================================
 # OBSERVER PATTERN - Event notification
 # ============================================================================
-class IObserver(ABC):
-    @abstractmethod
+class IObserver:
     def update(self, event: str, data: any):
-        pass
+        raise NotImplementedError
 
 
 class Subject:
-    """Observable subject that notifies observers"""
+    """Observable subject that notifies observers
+
+    Observers are kept in an insertion-ordered dict keyed by id(), giving
+    O(1) attach/detach membership checks. Their bound update methods are
+    published as an immutable tuple that attach/detach replace (copy-on-write),
+    so notify iterates a stable snapshot without locking and skips the
+    per-event attribute lookup.
+    """
+
+    __slots__ = ("_observers", "_callbacks")
 
     def __init__(self):
-        self._observers: List[IObserver] = []
+        self._observers: Dict[int, IObserver] = {}
+        self._callbacks: Tuple[Callable[[str, any], None], ...] = ()
 
     def attach(self, observer: IObserver):
-        if observer not in self._observers:
-            self._observers.append(observer)
+        key = id(observer)
+        if key not in self._observers:
+            self._observers[key] = observer
+            self._callbacks = self._callbacks + (observer.update,)
 
     def detach(self, observer: IObserver):
-        if observer in self._observers:
-            self._observers.remove(observer)
+        if self._observers.pop(id(observer), None) is not None:
+            self._callbacks = tuple(o.update for o in self._observers.values())
 
     def notify(self, event: str, data: any):
-        for observer in self._observers:
-            observer.update(event, data)
+        for callback in self._callbacks:
+            callback(event, data)
 
 
 class LoggingObserver(IObserver):
     def update(self, event: str, data: any):
-        print(f"[LOG] Event: {event}, Data: {data}")
+        _out_write(f"[LOG] Event: {event}, Data: {data}\n")
+
+
+# ============================================================================
+# ASYNC DISPATCH - Run side effects off the caller's thread
+# ============================================================================
+class AsyncDispatcher:
+    """Runs submitted calls in order on a background daemon thread
+
+    Call close() (or flush()) before exit: being a daemon, the worker drops
+    whatever is still queued when the interpreter shuts down.
+    """
+
+    def __init__(self):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, fn: Callable, *args):
+        if self._closed:
+            raise RuntimeError("AsyncDispatcher is closed")
+        self._queue.put((fn, args))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything submitted so far has run"""
+        done = threading.Event()
+        self.submit(done.set)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """Run everything submitted so far, then stop the worker thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            fn, args = item
+            try:
+                fn(*args)
+            except Exception:
+                traceback.print_exc()
 
 
 # ============================================================================
 # SERVICE LAYER - Business logic (Open/Closed Principle)
 # ============================================================================
 class BaseService:
-    """Base service with common functionality"""
+    """Base service with common functionality
+
+    config is a class attribute shared by every instance (ConfigManager is a
+    singleton). Because of __slots__, instances cannot assign self.config;
+    a subclass that needs a different config overrides the class attribute.
+    """
+
+    __slots__ = ("repository",)
+
+    config = ConfigManager()
 
     def __init__(self, repository: IRepository):
         self.repository = repository
-        self.config = ConfigManager()
 
     def validate(self, entity) -> bool:
         """Override in subclasses for validation logic"""
@@ -227,28 +557,129 @@ class BaseService:
 class UserService(BaseService):
     """Service handling user operations (Single Responsibility)"""
 
+    __slots__ = (
+        "notification_service",
+        "subject",
+        "_dispatcher",
+        "_get_cached",
+        "_version",
+    )
+
     def __init__(
-        self, repository: IRepository, notification_service: INotificationService
+        self,
+        repository: IRepository,
+        notification_service: INotificationService,
+        dispatcher: Optional[AsyncDispatcher] = None,
     ):
         super().__init__(repository)
         self.notification_service = notification_service
         self.subject = Subject()
+        self._dispatcher = dispatcher
+        # Read-through cache of recent lookups keyed by (version, id). Every
+        # write through this service bumps the version, so entries cached
+        # before it (even by a lookup racing the write) are never read again;
+        # writes made directly on the repository are not seen.
+        get_by_id = repository.get_by_id
+        self._get_cached = functools.lru_cache(maxsize=1024)(
+            lambda version, id: get_by_id(id)
+        )
+        self._version = 0
 
+    # str ids are sys.intern()ed when stored, so lookups with interned or
+    # literal ids match repository keys by identity; keep them short strings.
     def create_user(self, id: str, name: str, email: str) -> User:
+        """Store a new user, then send the welcome message and USER_CREATED
+
+        Notifications run inline unless the service was given a dispatcher.
+        With one, they run later on its thread: their exceptions are printed
+        there instead of reaching this caller, and they are lost at exit
+        unless the dispatcher is flushed or closed.
+        """
+        if type(id) is str:
+            id = sys.intern(id)
         user = User(id, name, email)
         if not self.validate(user):
             raise ValueError("Invalid user data")
 
         self.repository.save(user)
-        self.notification_service.send(email, "Welcome!")
-        self.subject.notify("USER_CREATED", user)
+        self._invalidate()
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            self.notification_service.send(email, "Welcome!")
+            self.subject.notify("USER_CREATED", user)
+        else:
+            dispatcher.submit(self.notification_service.send, email, "Welcome!")
+            dispatcher.submit(self.subject.notify, "USER_CREATED", user)
         return user
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for pending notifications to be delivered"""
+        if self._dispatcher is None:
+            return True
+        return self._dispatcher.flush(timeout)
+
+    def specialize(self, template: User) -> Callable[[str, str], User]:
+        """Return a fast create_user(id, name) for users shaped like template
+
+        The template is validated once; created users copy its email and
+        status, so each call skips validating them and only checks name.
+        Users are built with object.__new__ and direct slot writes, skipping
+        __init__. The returned creator is not cached here: it closes over
+        this service and template, so callers keep it for as long as they
+        need it.
+        """
+        if type(template) is not User:
+            raise TypeError("specialize() needs a plain User template")
+        if not self.validate(template):
+            raise ValueError("Invalid user data")
+        _new = object.__new__
+        _intern = sys.intern
+        _now = time.time_ns
+        _save = self.repository.save
+        _invalidate = self._invalidate
+        _dispatcher = self._dispatcher
+        _send = self.notification_service.send
+        _notify = self.subject.notify
+        _email = template.email
+        _status = template.status
+
+        def create_user(id: str, name: str) -> User:
+            if not name:
+                raise ValueError("Invalid user data")
+            user = _new(User)
+            user.id = _intern(id) if type(id) is str else id
+            user.name = name
+            user.email = _email
+            user.status = _status
+            user.created_at_ns = user.updated_at_ns = _now()
+            _save(user)
+            _invalidate()
+            if _dispatcher is None:
+                _send(_email, "Welcome!")
+                _notify("USER_CREATED", user)
+            else:
+                _dispatcher.submit(_send, _email, "Welcome!")
+                _dispatcher.submit(_notify, "USER_CREATED", user)
+            return user
+
+        return create_user
+
     def get_user(self, id: str) -> Optional[User]:
-        return self.repository.get_by_id(id)
+        return self._get_cached(self._version, id)
+
+    def delete_user(self, id: str):
+        # Deleted users are not released to User._pool: the caller and queued
+        # notifications may still hold them
+        self.repository.delete(id)
+        self._invalidate()
+
+    def _invalidate(self):
+        self._version += 1
 
     def validate(self, user: User) -> bool:
-        return user.name and user.email and "@" in user.email
+        name = user.name
+        email = user.email
+        return bool(name) and bool(email) and email.find("@") >= 0
 
 
 # ============================================================================